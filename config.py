@@ -1,7 +1,7 @@
 
 # Central configuration management
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 import os
 from dotenv import load_dotenv
@@ -19,9 +19,12 @@ class DatabaseConfig:
     password: str
     
     # Connection pool settings
+    # weekly_run runs 3 loaders at once and each holds one connection (the lineup
+    # loader's worker threads only call the API), so 3 + 2 headroom for ad-hoc queries.
     pool_size: int = 5
     max_overflow: int = 10
-    pool_recycle: int = 3600
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
     pool_pre_ping: bool = True
     
     @classmethod
@@ -58,9 +61,7 @@ class DatabaseConfig:
 class ETLConfig:
     """ETL pipeline configuration."""
     
-    default_sleep_seconds: float = 0.6
-    max_retries: int = 3
-    retry_backoff_seconds: list[int] = field(default_factory=lambda: [120, 200, 250])
+    api_max_rps: float = 4.0
     max_total_wait_seconds: int = 600
     batch_size: int = 100
     
@@ -68,8 +69,7 @@ class ETLConfig:
     def from_env(cls) -> "ETLConfig":
         """Load ETL configuration from environment variables."""
         return cls(
-            default_sleep_seconds=float(os.getenv("ETL_SLEEP_SECONDS", "0.6")),
-            max_retries=int(os.getenv("ETL_MAX_RETRIES", "3")),
+            api_max_rps=float(os.getenv("ETL_API_MAX_RPS", "4.0")),
             batch_size=int(os.getenv("ETL_BATCH_SIZE", "100")),
         )
 
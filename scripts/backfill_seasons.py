@@ -12,6 +12,7 @@ from src.etl.load_team_boxscores import load_teambox_scores
 from src.etl.load_dimplayers_boxscores import load_dimplayer_boxscores
 from src.etl.load_gamebygame_lineups import load_season_game_lineups_for_team
 from src.utils.logger import setup_logger, get_default_log_file
+from src.utils.ratelimit import LIMITER
 
 log_file = get_default_log_file("backfill")
 logger = setup_logger(__name__, log_file=log_file)
@@ -19,7 +20,6 @@ logger = setup_logger(__name__, log_file=log_file)
 
 def backfill_season(
     season: str,
-    sleep_seconds: float = 0.6,
     limit: int = None
 ) -> bool:
 
@@ -40,7 +40,6 @@ def backfill_season(
         load_game_structure(
             engine=engine,
             season=season,
-            sleep_seconds=sleep_seconds,
             limit=limit
         )
         
@@ -49,7 +48,6 @@ def backfill_season(
         load_teambox_scores(
             engine=engine,
             season=season,
-            sleep_seconds=sleep_seconds,
             limit=limit
         )
         
@@ -58,7 +56,6 @@ def backfill_season(
         load_dimplayer_boxscores(
             engine=engine,
             season=season,
-            sleep_seconds=sleep_seconds,
             limit=limit
         )
         
@@ -75,8 +72,8 @@ def backfill_season(
             season="2025-26",
             team_id=1610612750,  # Timberwolves
             group_quantity=5,
-            limit=None,  
-            sleep_seconds=1.0
+            limit=None,
+            bulk=True
         )
         
         duration = (datetime.now() - start_time).total_seconds()
@@ -141,8 +138,8 @@ Examples:
   # Backfill multiple seasons
   python scripts/backfill_seasons.py 2021-22 2022-23 2023-24
   
-  # Backfill with custom sleep time
-  python scripts/backfill_seasons.py 2023-24 --sleep 1.0
+  # Backfill with a custom API request rate
+  python scripts/backfill_seasons.py 2023-24 --max-rps 2
   
   # Test with limited games
   python scripts/backfill_seasons.py 2024-25 --limit 10
@@ -155,10 +152,10 @@ Examples:
         help="Seasons to backfill (e.g., 2022-23 2023-24)"
     )
     parser.add_argument(
-        "--sleep",
+        "--max-rps",
         type=float,
         default=None,
-        help="Sleep seconds between API calls (default: from config)"
+        help="Max NBA API requests per second (default: from config)"
     )
     parser.add_argument(
         "--limit",
@@ -176,15 +173,16 @@ Examples:
         logger.error("Seasons must be in format YYYY-YY (e.g., 2023-24)")
         return 1
     
-    # Get sleep time from args or config
+    # Get API request rate from args or config
     config = get_config()
-    sleep_seconds = args.sleep if args.sleep is not None else config.etl.default_sleep_seconds
+    max_rps = args.max_rps if args.max_rps is not None else config.etl.api_max_rps
+    LIMITER.configure(max_rate=max_rps)
     
     logger.info("=" * 80)
     logger.info("WOLVES ANALYTICS - SEASON BACKFILL")
     logger.info("=" * 80)
     logger.info(f"Seasons to backfill: {', '.join(args.seasons)}")
-    logger.info(f"Sleep between API calls: {sleep_seconds}s")
+    logger.info(f"Max API requests per second: {max_rps}")
     if args.limit:
         logger.info(f"Limit: {args.limit} games per season")
     logger.info("")
@@ -200,7 +198,6 @@ Examples:
         
         success = backfill_season(
             season=season,
-            sleep_seconds=sleep_seconds,
             limit=args.limit
         )
         
@@ -4,12 +4,12 @@ Weekly batch pipeline runner for Wolves Analytics.
 Orchestrates the full ETL pipeline:
 1. Load spine (game IDs for season)
 2. Load game structure and team dimensions
-3. Load team boxscores
-4. Load player dimensions and boxscores
-5. Load lineup data
+3. Load team boxscores, player dimensions/boxscores and lineup data
+   (concurrently; all three only depend on step 2)
 
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +20,7 @@ from src.etl.load_factgames_dimteams import load_game_structure
 from src.etl.load_team_boxscores import load_teambox_scores
 from src.etl.load_dimplayers_boxscores import load_dimplayer_boxscores
 from src.utils.logger import setup_logger, get_default_log_file
+from src.utils.ratelimit import LIMITER
 from src.etl.load_gamebygame_lineups import load_season_game_lineups_for_team
 
 
@@ -63,8 +64,9 @@ def main() -> int:
         current_season = get_current_season()
         
         logger.info(f"Season: {current_season}")
-        logger.info(f"Sleep between API calls: {config.etl.default_sleep_seconds}s")
-        logger.info(f"Max retries: {config.etl.max_retries}")
+        logger.info(f"Max API requests per second: {config.etl.api_max_rps}")
+        
+        LIMITER.configure(max_rate=config.etl.api_max_rps)
         
         engine = get_engine()
         logger.info("Database engine initialized")
@@ -84,50 +86,45 @@ def main() -> int:
         load_game_structure(
             engine=engine,
             season=current_season,
-            sleep_seconds=config.etl.default_sleep_seconds,
             limit=None
         )
         
-        # Fill team boxscores for games missing teambox rows
+        # Team boxscores, player boxscores and lineups only depend on fact_games,
+        # so they run side by side; API calls still share the global rate limiter
         logger.info("")
         logger.info("-" * 80)
-        logger.info("Loading team boxscores")
+        logger.info("Loading team boxscores, player dimensions/boxscores and Timberwolves lineup data")
         logger.info("-" * 80)
-        load_teambox_scores(
-            engine=engine,
-            season=current_season,
-            sleep_seconds=config.etl.default_sleep_seconds,
-            limit=None
-        )
         
-        # Fill player dimension + player boxscores for games missing playerbox rows
-        logger.info("")
-        logger.info("-" * 80)
-        logger.info("Loading player dimensions and boxscores")
-        logger.info("-" * 80)
-        load_dimplayer_boxscores(
-            engine=engine,
-            season=current_season,
-            sleep_seconds=config.etl.default_sleep_seconds,
-            limit=None
-        )
-
-        logger.info("")
-        logger.info("-" * 80)
-        logger.info("Loading Timberwolves lineup data")
-        logger.info("-" * 80)
-
-
-        # Load in lineup specific stats 
-          
-        load_season_game_lineups_for_team(
-            engine=engine,
-            season="2025-26",
-            team_id=1610612750,  # Timberwolves
-            group_quantity=5,
-            limit=None,  
-            sleep_seconds=1.0
-        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                # Fill team boxscores for games missing teambox rows
+                executor.submit(
+                    load_teambox_scores,
+                    engine=engine,
+                    season=current_season,
+                    limit=None
+                ),
+                # Fill player dimension + player boxscores for games missing playerbox rows
+                executor.submit(
+                    load_dimplayer_boxscores,
+                    engine=engine,
+                    season=current_season,
+                    limit=None
+                ),
+                # Load in lineup specific stats 
+                executor.submit(
+                    load_season_game_lineups_for_team,
+                    engine=engine,
+                    season="2025-26",
+                    team_id=1610612750,  # Timberwolves
+                    group_quantity=5,
+                    limit=None
+                ),
+            ]
+            
+            for future in futures:
+                future.result()
 
         # Success summary
         duration = (datetime.now() - start_time).total_seconds()
@@ -1,6 +1,7 @@
+import logging
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.pool import Pool
 from typing import Optional
 
 from config import get_config
@@ -30,8 +31,10 @@ def get_engine(force_reload: bool = False) -> Engine:
         # Connection pool settings
         pool_size=db_config.pool_size,
         max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
         pool_recycle=db_config.pool_recycle,
         pool_pre_ping=db_config.pool_pre_ping,
+        pool_use_lifo=True,  # reuse the most recently returned (warm) connection
         
         # Connection arguments
         connect_args={
@@ -40,7 +43,6 @@ def get_engine(force_reload: bool = False) -> Engine:
         },
         
         echo=False,
-        poolclass=None, 
     )
     
     _setup_engine_events(_engine)
@@ -52,6 +54,9 @@ def get_engine(force_reload: bool = False) -> Engine:
 
 def _setup_engine_events(engine: Engine) -> None:
 
+    # Listeners run on every pool operation; skip them unless they would actually log
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     
     @event.listens_for(engine, "connect")
     def receive_connect(dbapi_conn, connection_record):
@@ -61,11 +66,12 @@ def _setup_engine_events(engine: Engine) -> None:
     def receive_close(dbapi_conn, connection_record):
         logger.debug("Database connection closed")
     
-    @event.listens_for(Pool, "checkout")
+    # Bound to this engine's pool, not the Pool class, so other engines (e.g. tests) are unaffected
+    @event.listens_for(engine.pool, "checkout")
     def receive_checkout(dbapi_conn, connection_record, connection_proxy):
         logger.debug("Connection checked out from pool")
     
-    @event.listens_for(Pool, "checkin")
+    @event.listens_for(engine.pool, "checkin")
     def receive_checkin(dbapi_conn, connection_record):
         logger.debug("Connection returned to pool")
 
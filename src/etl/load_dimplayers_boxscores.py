@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from typing import Any, Optional, List, Dict
 
@@ -139,6 +138,10 @@ ON CONFLICT (game_id, player_id) DO UPDATE SET
   last_updated_at = NOW();
 """
 
+SELECT_GAMES_MISSING_PLAYERBOX_STMT = text(SQL_SELECT_GAMES_MISSING_PLAYERBOX)
+UPSERT_DIM_PLAYERS_SEED_STMT = text(SQL_UPSERT_DIM_PLAYERS_SEED)
+UPSERT_PLAYERBOX_STMT = text(SQL_UPSERT_PLAYERBOX)
+
 # Parsing PlayerStats
 
 
@@ -243,12 +246,11 @@ def extract_dimplayer_boxscores(
 def load_dimplayer_boxscores(
     engine: Engine,
     season: str,
-    sleep_seconds: float = 0.8,
     limit: Optional[int] = None
 ) -> None:
     with engine.begin() as conn:
         rows = conn.execute(
-            text(SQL_SELECT_GAMES_MISSING_PLAYERBOX),
+            SELECT_GAMES_MISSING_PLAYERBOX_STMT,
             {"season": season},
         ).mappings().all()
 
@@ -276,7 +278,7 @@ def load_dimplayer_boxscores(
             with engine.begin() as conn:
                 for drow in dim_seeds:
                     conn.execute(
-                        text(SQL_UPSERT_DIM_PLAYERS_SEED),
+                        UPSERT_DIM_PLAYERS_SEED_STMT,
                         {
                             "player_id": drow.player_id,
                             "full_name": drow.full_name,
@@ -288,7 +290,7 @@ def load_dimplayer_boxscores(
 
                 for row in box_rows:
                     conn.execute(
-                        text(SQL_UPSERT_PLAYERBOX),
+                        UPSERT_PLAYERBOX_STMT,
                         {
                             "game_id": row.game_id,
                             "player_id": row.player_id,
@@ -328,6 +330,4 @@ def load_dimplayer_boxscores(
                         game_id=game_id
                     )
 
-        time.sleep(sleep_seconds)
-
     logger.info(f"Player boxscore load complete. Success={success}, Failed={failed}, Attempted={len(rows)}")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -96,6 +95,10 @@ ON CONFLICT (team_id) DO UPDATE SET
   last_updated_at = NOW();
 """
 
+SELECT_MISSING_GAMES_STMT = text(SQL_SELECT_MISSING_GAMES)
+UPSERT_FACT_GAMES_STMT = text(SQL_UPSERT_FACT_GAMES)
+UPSERT_DIM_TEAMS_STMT = text(SQL_UPSERT_DIM_TEAMS)
+
 
 
 # NBA API extraction 
@@ -188,13 +191,12 @@ def extract_game_structure(
 def load_game_structure(
     engine: Engine,
     season: str,
-    sleep_seconds: float = 1.2,
     limit: Optional[int] = None
 ) -> None:
 
     with engine.begin() as conn:
         rows = conn.execute(
-            text(SQL_SELECT_MISSING_GAMES),
+            SELECT_MISSING_GAMES_STMT,
             {"season": season},
         ).mappings().all()
 
@@ -223,7 +225,7 @@ def load_game_structure(
             with engine.begin() as conn:
                 for t in team_dim_rows:
                     conn.execute(
-                        text(SQL_UPSERT_DIM_TEAMS),
+                        UPSERT_DIM_TEAMS_STMT,
                         {
                             "team_id": t.team_id,
                             "abbreviation": t.abbreviation,
@@ -234,7 +236,7 @@ def load_game_structure(
                     )
 
                 conn.execute(
-                    text(SQL_UPSERT_FACT_GAMES),
+                    UPSERT_FACT_GAMES_STMT,
                     {
                         "game_id": game_insert.game_id,
                         "season": game_insert.season,
@@ -257,8 +259,6 @@ def load_game_structure(
             failed += 1
             logger.error(f"ERROR loading game_id={game_id}: {e}")
 
-        time.sleep(sleep_seconds)
-
     logger.info(
     f"Game structure complete. Success={success}, Failed={failed}, Attempted={len(rows)}"
 )
\ No newline at end of file
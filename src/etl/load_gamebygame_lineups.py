@@ -1,87 +1,118 @@
 from __future__ import annotations
 
-import time
-from dataclasses import dataclass
-from typing import Optional, List
-from datetime import datetime, timedelta
+import asyncio
+import csv
+import io
+import re
+from typing import Dict, Optional, List, Set, Tuple
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+from psycopg2.extras import execute_values
 from nba_api.stats.endpoints import leaguedashlineups
 
 from src.utils.nba_utils import call_with_retries
-from src.etl.parsing_utils import parse_int, parse_float
+from src.etl.parsing_utils import parse_int
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@dataclass
-class GameLineupRow:
-    # Game-level lineup performance data
-    
-    game_id: str 
-    game_date: str
-    season: str
-    team_id: int
-    group_quantity: int
-    group_id: str
-    group_name: Optional[str]
-    opponent_team_id: Optional[int]
-    is_home: Optional[bool]
-    min: Optional[float]
-    plus_minus: Optional[int]
-    pts: Optional[int]
-    fgm: Optional[int]
-    fga: Optional[int]
-    fg_pct: Optional[float] 
-    fg3m: Optional[int]
-    fg3a: Optional[int]
-    fg3_pct: Optional[float] 
-    ftm: Optional[int]
-    fta: Optional[int]
-    ft_pct: Optional[float]  
-    reb: Optional[int]
-    ast: Optional[int]
-    tov: Optional[int]
-    stl: Optional[int]
-    blk: Optional[int]
-    pf: Optional[int]
+# On-disk cache of raw leaguedashlineups responses for completed dates
+LINEUP_CACHE_DIR = Path("cache") / "lineups"
+
+# game_date is the US local date and late West Coast games finish around 07:00 UTC
+# the next day, so data is only treated as final from noon UTC the day after
+GAME_FINAL_AFTER = timedelta(days=1, hours=12)
+
+# API column -> lineup_game_logs column / upsert bind name
+LINEUP_INT_COLUMNS = {
+    'PLUS_MINUS': 'plus_minus',
+    'PTS': 'pts',
+    'FGM': 'fgm',
+    'FGA': 'fga',
+    'FG3M': 'fg3m',
+    'FG3A': 'fg3a',
+    'FTM': 'ftm',
+    'FTA': 'fta',
+    'REB': 'reb',
+    'AST': 'ast',
+    'TOV': 'tov',
+    'STL': 'stl',
+    'BLK': 'blk',
+    'PF': 'pf',
+}
+
+LINEUP_FLOAT_COLUMNS = {
+    'MIN': 'min',
+    'FG_PCT': 'fg_pct',
+    'FG3_PCT': 'fg3_pct',
+    'FT_PCT': 'ft_pct',
+}
+
+
+# Last name from one player in GROUP_NAME: text after the first ". " ("N. Alexander-Walker"),
+# else the last word ("Rudy Gobert"), else the whole token ("Nene")
+_LAST_NAME_RE = re.compile(r"^(?:.*?\. |.* )?(.+)$")
 
 
 def clean_player_names(group_name_raw: str) -> str:
     if not group_name_raw or not isinstance(group_name_raw, str):
         return None
     
-    parts = group_name_raw.split(" - ")
-    cleaned_names = []
-    
-    for name in parts:
-        name = name.strip()
-        if not name:
-            continue
-        
-        if '. ' in name:
-            last_name = name.split('. ', 1)[-1]
-            cleaned_names.append(last_name)
-        elif ' ' in name:
-            last_name = name.split()[-1]
-            cleaned_names.append(last_name)
-        else:
-            cleaned_names.append(name)
+    cleaned_names = [
+        _LAST_NAME_RE.match(name).group(1)
+        for name in (part.strip() for part in group_name_raw.split(" - "))
+        if name
+    ]
     
     return "; ".join(cleaned_names) if cleaned_names else None
 
 
-def extract_lineups_for_date(
+def clean_player_names_series(group_names: pd.Series) -> pd.Series:
+    # Vectorized clean_player_names over a whole GROUP_NAME column (NaN where it returns None)
+
+    # An all-null (or missing) column comes back as float64, which has no .str accessor
+    group_names = group_names.astype(object)
+    parts = group_names.str.split(" - ", regex=False).explode().str.strip()
+    parts = parts[parts.notna() & (parts != "")]
+    
+    last_names = parts.str.extract(_LAST_NAME_RE, expand=False)
+    
+    return last_names.groupby(level=0).agg("; ".join).reindex(group_names.index)
+
+
+def is_game_final(game_date: date, now: Optional[datetime] = None) -> bool:
+    # Same cutoff as SQL_SELECT_LOADED_DATES, applied in UTC
+    now = now or datetime.now(timezone.utc)
+    final_at = datetime.combine(game_date, datetime.min.time(), tzinfo=timezone.utc) + GAME_FINAL_AFTER
+    return now >= final_at
+
+
+def _lineup_cache_path(game_date: date, season: str, team_id: int, group_quantity: int) -> Path:
+    return LINEUP_CACHE_DIR / season / str(team_id) / str(group_quantity) / f"{game_date:%Y-%m-%d}.pkl"
+
+
+def _fetch_lineups_frame(
     game_date: str,
     season: str,
     team_id: int,
-    group_quantity: int = 5
-) -> List[GameLineupRow]:
-
-    logger.debug(f"Fetching lineup data for date {game_date}, team {team_id}")
+    group_quantity: int
+) -> pd.DataFrame:
+    # Final dates never change, so their responses are served from disk on re-runs
 
+    date_obj = datetime.strptime(game_date, '%m/%d/%Y').date()
+    cacheable = is_game_final(date_obj)
+    cache_path = _lineup_cache_path(date_obj, season, team_id, group_quantity)
+    
+    if cacheable and cache_path.exists():
+        logger.debug(f"Using cached lineup data for {game_date} ({cache_path})")
+        return pd.read_pickle(cache_path)
+    
     endpoint = call_with_retries(
         lambda: leaguedashlineups.LeagueDashLineups(
             season=season,
@@ -96,13 +127,41 @@ def extract_lineups_for_date(
     )
     
     dfs = endpoint.get_data_frames()
+    df = dfs[0] if dfs else pd.DataFrame()
+    
+    # Empty responses are not cached so a bad fetch gets retried next run
+    if cacheable and not df.empty:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        df.to_pickle(tmp_path)
+        tmp_path.replace(cache_path)
+    
+    return df
+
+
+def _to_int_column(col: pd.Series) -> pd.Series:
+    # Same results as parse_int: numbers truncate, strings must be whole numbers ("5.5" -> None)
+    if not pd.api.types.is_numeric_dtype(col):
+        return col.map(parse_int).astype('Int64')
+    return np.trunc(col.astype(float)).astype('Int64')
+
+
+def extract_lineups_for_date(
+    game_date: str,
+    season: str,
+    team_id: int,
+    group_quantity: int = 5
+) -> List[dict]:
+    # game_id, game_date, opponent_team_id and is_home are filled in by the loader
+
+    logger.debug(f"Fetching lineup data for date {game_date}, team {team_id}")
+
+    df = _fetch_lineups_frame(game_date, season, team_id, group_quantity)
     
-    if not dfs or dfs[0].empty:
+    if df.empty:
         logger.debug(f"No lineup data for {game_date}")
         return []
     
-    df = dfs[0]
-    
     df = df[df['TEAM_ID'] == team_id]
     
     if df.empty:
@@ -111,97 +170,91 @@ def extract_lineups_for_date(
     
     logger.info(f"Found {len(df)} lineups for team {team_id} on {game_date}")
     
-    lineup_rows = []
+    # Coerce whole columns at once instead of parsing cell by cell
+    stats = pd.concat([
+        df.reindex(columns=list(LINEUP_INT_COLUMNS)).apply(_to_int_column),
+        df.reindex(columns=list(LINEUP_FLOAT_COLUMNS)).apply(pd.to_numeric, errors='coerce'),
+    ], axis=1).rename(columns={**LINEUP_INT_COLUMNS, **LINEUP_FLOAT_COLUMNS})
     
-    for idx, row in df.iterrows():
-        group_id = str(row.get('GROUP_ID', ''))
-        if not group_id or group_id == 'nan':
-            group_id = f"date_{game_date.replace('/', '')}_lineup_{idx}"
-        
-        group_name_raw = row.get('GROUP_NAME')
-        group_name = clean_player_names(group_name_raw)
-        
-        lineup_row = GameLineupRow(
-            game_id='',  
-            game_date=game_date,
-            season=season,
-            team_id=team_id,
-            group_quantity=group_quantity,
-            
-            group_id=group_id,
-            group_name=group_name,
-            
-  
-            opponent_team_id=None,
-            is_home=None,
-            
-   
-            min=parse_float(row.get('MIN')),
-            plus_minus=parse_int(row.get('PLUS_MINUS')),
-            
-            pts=parse_int(row.get('PTS')),
-            fgm=parse_int(row.get('FGM')),
-            fga=parse_int(row.get('FGA')),
-            fg_pct=parse_float(row.get('FG_PCT')),
-            
-            fg3m=parse_int(row.get('FG3M')),
-            fg3a=parse_int(row.get('FG3A')),
-            fg3_pct=parse_float(row.get('FG3_PCT')),
-            
-            ftm=parse_int(row.get('FTM')),
-            fta=parse_int(row.get('FTA')),
-            ft_pct=parse_float(row.get('FT_PCT')),
-            
-            reb=parse_int(row.get('REB')),
-            ast=parse_int(row.get('AST')),
-            tov=parse_int(row.get('TOV')),
-            stl=parse_int(row.get('STL')),
-            blk=parse_int(row.get('BLK')),
-            pf=parse_int(row.get('PF')),
-        )
-        
-        lineup_rows.append(lineup_row)
+    raw_ids = df.reindex(columns=['GROUP_ID'])['GROUP_ID']
+    group_ids = raw_ids.map(str)
+    fallback_ids = f"date_{game_date.replace('/', '')}_lineup_" + df.index.to_series().astype(str)
+    group_ids = group_ids.where(~(raw_ids.isna() | group_ids.isin(['', 'nan'])), fallback_ids)
+    
+    stats.insert(0, 'group_id', group_ids)
+    stats.insert(1, 'group_name', clean_player_names_series(df.reindex(columns=['GROUP_NAME'])['GROUP_NAME']))
     
-    return lineup_rows
+    # None instead of NaN/NA so values bind as SQL NULL
+    records = stats.astype(object).where(stats.notna(), None).to_dict(orient='records')
+    
+    for record in records:
+        record["season"] = season
+        record["team_id"] = team_id
+        record["group_quantity"] = group_quantity
+    
+    return records
 
 
-def get_game_info_for_date(engine: Engine, game_date: str, team_id: int) -> Optional[dict]:
+SQL_SELECT_SEASON_GAMES = """
+SELECT
+    game_date,
+    game_id,
+    home_team_id,
+    away_team_id
+FROM nba.fact_games
+WHERE season = :season
+  AND (home_team_id = :team_id OR away_team_id = :team_id)
+ORDER BY game_date;
+"""
 
-    try:
-        date_obj = datetime.strptime(game_date, '%m/%d/%Y')
-        sql_date = date_obj.strftime('%Y-%m-%d')
-    except:
-        logger.error(f"Invalid date format: {game_date}")
-        return None
+# A date only counts as loaded once every row was written after the game was
+# final (:final_after is GAME_FINAL_AFTER); earlier rows may be a mid-game
+# partial load and get re-fetched.
+SQL_SELECT_LOADED_DATES = """
+SELECT game_date
+FROM nba.lineup_game_logs
+WHERE team_id = :team_id
+  AND group_quantity = :group_quantity
+  AND game_date < CURRENT_DATE
+GROUP BY game_date
+HAVING MIN(last_updated_at) >= game_date + :final_after;
+"""
+
+# Built once at import rather than re-parsing the SQL with text() on every call
+SELECT_SEASON_GAMES_STMT = text(SQL_SELECT_SEASON_GAMES)
+SELECT_LOADED_DATES_STMT = text(SQL_SELECT_LOADED_DATES)
+
+
+def get_game_info_by_date(conn: Connection, season: str, team_id: int) -> Dict[date, dict]:
+    # One query for the whole season instead of one per date
+
+    rows = conn.execute(SELECT_SEASON_GAMES_STMT, {
+        "season": season,
+        "team_id": team_id
+    }).fetchall()
     
-    query = text("""
-        SELECT 
-            game_id,
-            game_date,
-            home_team_id,
-            away_team_id,
-            CASE WHEN home_team_id = :team_id THEN TRUE ELSE FALSE END as is_home,
-            CASE WHEN home_team_id = :team_id THEN away_team_id ELSE home_team_id END as opponent_id
-        FROM nba.fact_games
-        WHERE game_date = :game_date
-          AND (home_team_id = :team_id OR away_team_id = :team_id)
-        LIMIT 1
-    """)
+    game_info_by_date = {}
+    for game_date, game_id, home_team_id, away_team_id in rows:
+        is_home = home_team_id == team_id
+        game_info_by_date[game_date] = {
+            "game_id": game_id,
+            "is_home": is_home,
+            "opponent_team_id": away_team_id if is_home else home_team_id
+        }
     
-    with engine.connect() as conn:
-        result = conn.execute(query, {
-            "game_date": sql_date,
-            "team_id": team_id
-        }).fetchone()
+    return game_info_by_date
+
+
+def get_loaded_dates(conn: Connection, team_id: int, group_quantity: int) -> Set[date]:
+    # Past dates fully loaded after the game ended; today and partial loads stay eligible
+
+    rows = conn.execute(SELECT_LOADED_DATES_STMT, {
+        "team_id": team_id,
+        "group_quantity": group_quantity,
+        "final_after": GAME_FINAL_AFTER
+    }).fetchall()
     
-    if result:
-        return {
-            "game_id": result[0],
-            "is_home": result[4],
-            "opponent_team_id": result[5]
-        }
-    else:
-        return None
+    return {row[0] for row in rows}
 
 
 SQL_UPSERT_GAME_LINEUP = """
@@ -216,17 +269,113 @@ INSERT INTO nba.lineup_game_logs (
     reb, ast, tov, stl, blk, pf,
     last_updated_at
 )
-VALUES (
-    :game_id, :season, :team_id, :group_quantity,
-    :group_id, :group_name,
-    :opponent_team_id, :is_home, :game_date,
-    :min, :plus_minus,
-    :pts, :fgm, :fga, :fg_pct,
-    :fg3m, :fg3a, :fg3_pct,
-    :ftm, :fta, :ft_pct,
-    :reb, :ast, :tov, :stl, :blk, :pf,
+VALUES %s
+ON CONFLICT (game_id, team_id, group_id) DO UPDATE SET
+    group_name = EXCLUDED.group_name,
+    opponent_team_id = EXCLUDED.opponent_team_id,
+    is_home = EXCLUDED.is_home,
+    game_date = EXCLUDED.game_date,
+    min = EXCLUDED.min,
+    plus_minus = EXCLUDED.plus_minus,
+    pts = EXCLUDED.pts,
+    fgm = EXCLUDED.fgm,
+    fga = EXCLUDED.fga,
+    fg_pct = EXCLUDED.fg_pct,
+    fg3m = EXCLUDED.fg3m,
+    fg3a = EXCLUDED.fg3a,
+    fg3_pct = EXCLUDED.fg3_pct,
+    ftm = EXCLUDED.ftm,
+    fta = EXCLUDED.fta,
+    ft_pct = EXCLUDED.ft_pct,
+    reb = EXCLUDED.reb,
+    ast = EXCLUDED.ast,
+    tov = EXCLUDED.tov,
+    stl = EXCLUDED.stl,
+    blk = EXCLUDED.blk,
+    pf = EXCLUDED.pf,
+    last_updated_at = NOW();
+"""
+
+# Row template for execute_values; keys match the params dicts built per lineup.
+# execute_values expands this client-side into one multi-row statement per page,
+# so there is no per-row statement to PREPARE server-side.
+LINEUP_VALUES_TEMPLATE = """(
+    %(game_id)s, %(season)s, %(team_id)s, %(group_quantity)s,
+    %(group_id)s, %(group_name)s,
+    %(opponent_team_id)s, %(is_home)s, %(game_date)s,
+    %(min)s, %(plus_minus)s,
+    %(pts)s, %(fgm)s, %(fga)s, %(fg_pct)s,
+    %(fg3m)s, %(fg3a)s, %(fg3_pct)s,
+    %(ftm)s, %(fta)s, %(ft_pct)s,
+    %(reb)s, %(ast)s, %(tov)s, %(stl)s, %(blk)s, %(pf)s,
     NOW()
+)"""
+
+
+def upsert_lineups(conn: Connection, params_list: List[dict], page_size: int = 100) -> int:
+    # Multi-row upsert in one round-trip per page instead of one per lineup
+
+    if not params_list:
+        return 0
+
+    cur = conn.connection.cursor()
+    try:
+        execute_values(
+            cur,
+            SQL_UPSERT_GAME_LINEUP,
+            params_list,
+            template=LINEUP_VALUES_TEMPLATE,
+            page_size=page_size,
+        )
+    finally:
+        cur.close()
+
+    return len(params_list)
+
+
+# Column order shared by the COPY statement and the CSV rows fed to it
+LINEUP_COPY_COLUMNS = (
+    "game_id", "season", "team_id", "group_quantity",
+    "group_id", "group_name",
+    "opponent_team_id", "is_home", "game_date",
+    "min", "plus_minus",
+    "pts", "fgm", "fga", "fg_pct",
+    "fg3m", "fg3a", "fg3_pct",
+    "ftm", "fta", "ft_pct",
+    "reb", "ast", "tov", "stl", "blk", "pf",
 )
+
+SQL_CREATE_TMP_LINEUPS = """
+CREATE TEMP TABLE tmp_lineups (LIKE nba.lineup_game_logs INCLUDING DEFAULTS) ON COMMIT DROP;
+"""
+
+SQL_COPY_TMP_LINEUPS = f"""
+COPY tmp_lineups ({", ".join(LINEUP_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)
+"""
+
+SQL_MERGE_TMP_LINEUPS = """
+INSERT INTO nba.lineup_game_logs (
+    game_id, season, team_id, group_quantity,
+    group_id, group_name,
+    opponent_team_id, is_home, game_date,
+    min, plus_minus,
+    pts, fgm, fga, fg_pct,
+    fg3m, fg3a, fg3_pct,
+    ftm, fta, ft_pct,
+    reb, ast, tov, stl, blk, pf,
+    last_updated_at
+)
+SELECT
+    game_id, season, team_id, group_quantity,
+    group_id, group_name,
+    opponent_team_id, is_home, game_date,
+    min, plus_minus,
+    pts, fgm, fga, fg_pct,
+    fg3m, fg3a, fg3_pct,
+    ftm, fta, ft_pct,
+    reb, ast, tov, stl, blk, pf,
+    NOW()
+FROM tmp_lineups
 ON CONFLICT (game_id, team_id, group_id) DO UPDATE SET
     group_name = EXCLUDED.group_name,
     opponent_team_id = EXCLUDED.opponent_team_id,
@@ -254,128 +403,161 @@ ON CONFLICT (game_id, team_id, group_id) DO UPDATE SET
 """
 
 
-def load_season_game_lineups_for_team(
+def _lineups_to_csv(rows: List[dict]) -> io.StringIO:
+    # CSV in LINEUP_COPY_COLUMNS order, rewound and ready for copy_expert
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        # None is written as an unquoted empty field, which COPY reads as NULL
+        writer.writerow([row.get(col) for col in LINEUP_COPY_COLUMNS])
+    buf.seek(0)
+    return buf
+
+
+def bulk_load_lineups(conn: Connection, rows: List[dict]) -> int:
+    # COPY into a transaction-scoped temp table, then upsert from it in one statement.
+    # Must run inside a transaction (conn.begin()) so ON COMMIT DROP cleans up.
+
+    if not rows:
+        return 0
+
+    buf = _lineups_to_csv(rows)
+
+    cur = conn.connection.cursor()
+    try:
+        cur.execute(SQL_CREATE_TMP_LINEUPS)
+        cur.copy_expert(SQL_COPY_TMP_LINEUPS, buf)
+        cur.execute(SQL_MERGE_TMP_LINEUPS)
+    finally:
+        cur.close()
+
+    return len(rows)
+
+
+async def _load_lineups_for_date(
+    conn: Connection,
+    api_date: str,
+    sql_date: str,
+    game_info: dict,
+    season: str,
+    team_id: int,
+    group_quantity: int,
+    label: str,
+    pending: Optional[List[dict]] = None
+) -> Tuple[str, int]:
+    # Fetch and upsert one date. Returns (status, rows loaded).
+    # Only the API fetch runs in a worker thread; the upsert stays on the event loop
+    # thread so the loader's single connection is never used from two threads.
+    # With pending given, rows are collected there for one bulk load instead.
+
+    logger.info(f"{label} Processing date {api_date}...")
+
+    try:
+
+        lineup_rows = await asyncio.get_running_loop().run_in_executor(
+            None, extract_lineups_for_date, api_date, season, team_id, group_quantity
+        )
+        
+        if not lineup_rows:
+            logger.debug(f"  → No lineup data (future game or rest day)")
+            return "no_data", 0
+        
+
+        for row in lineup_rows:
+            row["game_id"] = game_info["game_id"]
+            row["opponent_team_id"] = game_info["opponent_team_id"]
+            row["is_home"] = game_info["is_home"]
+            row["game_date"] = sql_date
+
+        if pending is not None:
+            pending.extend(lineup_rows)
+            logger.info(f"  → Fetched {len(lineup_rows)} lineups for game {game_info['game_id']}")
+            return "success", len(lineup_rows)
+
+        with conn.begin():
+            loaded = upsert_lineups(conn, lineup_rows)
+        
+        logger.info(f"  → Loaded {loaded} lineups for game {game_info['game_id']}")
+        return "success", loaded
+        
+    except Exception as e:
+        logger.error(f"  → Failed {api_date}: {e}")
+        return "failed", 0
+
+
+async def load_season_game_lineups_for_team_async(
     engine: Engine,
     season: str,
     team_id: int,
     group_quantity: int = 5,
     limit: Optional[int] = None,
-    sleep_seconds: float = 1.0
+    max_concurrency: int = 4,
+    bulk: bool = False
 ) -> int:
+    # bulk=True (backfills) collects every date's rows and loads them with one
+    # COPY in one transaction; otherwise each date is upserted as it arrives.
     
     logger.info(f"Loading game-by-game lineups for team {team_id}, season {season}")
     logger.info(f"Using date-based approach (DateFrom/DateTo)")
     
-
-    query = text("""
-        SELECT DISTINCT game_date
-        FROM nba.fact_games
-        WHERE (home_team_id = :team_id OR away_team_id = :team_id)
-          AND season = :season
-        ORDER BY game_date
-    """)
-    
+    # One connection for the whole run; each date gets its own transaction on it
     with engine.connect() as conn:
-        game_dates = conn.execute(query, {
-            "team_id": team_id,
-            "season": season
-        }).fetchall()
-    
-
-    date_list = []
-    for row in game_dates:
-        date_obj = row[0]  
 
-        date_str = date_obj.strftime('%m/%d/%Y')
-        date_list.append((date_str, date_obj))
-    
-    if limit:
-        date_list = date_list[:limit]
-    
-    logger.info(f"Found {len(date_list)} game dates to process")
-    
-    total_loaded = 0
-    success_count = 0
-    fail_count = 0
-    no_data_count = 0
-    
-    for i, (api_date, sql_date) in enumerate(date_list, 1):
-        logger.info(f"[{i}/{len(date_list)}] Processing date {api_date}...")
+        with conn.begin():
+            game_info_by_date = get_game_info_by_date(conn, season, team_id)
+            loaded_dates = get_loaded_dates(conn, team_id, group_quantity)
+        
+        game_dates = list(game_info_by_date)
+        
+        if loaded_dates:
+            before = len(game_dates)
+            game_dates = [d for d in game_dates if d not in loaded_dates]
+            logger.info(f"Skipping {before - len(game_dates)} dates already in lineup_game_logs")
         
-        try:
-
-            lineup_rows = extract_lineups_for_date(
-                api_date, season, team_id, group_quantity
-            )
-            
-            if not lineup_rows:
-                logger.debug(f"  → No lineup data (future game or rest day)")
-                no_data_count += 1
-                time.sleep(sleep_seconds)
-                continue
-            
-            game_info = get_game_info_for_date(engine, api_date, team_id)
-            
-            if not game_info:
-                logger.warning(f"  → No game found in fact_games for {api_date}")
-                no_data_count += 1
-                time.sleep(sleep_seconds)
-                continue
-            
-
-            for lineup in lineup_rows:
-                lineup.game_id = game_info['game_id']
-                lineup.opponent_team_id = game_info['opponent_team_id']
-                lineup.is_home = game_info['is_home']
-            
-
-            loaded = 0
-            with engine.begin() as conn:
-                for lineup in lineup_rows:
-
-                    sql_game_date = sql_date.strftime('%Y-%m-%d')
-                    
-                    conn.execute(text(SQL_UPSERT_GAME_LINEUP), {
-                        "game_id": lineup.game_id,
-                        "season": lineup.season,
-                        "team_id": lineup.team_id,
-                        "group_quantity": lineup.group_quantity,
-                        "group_id": lineup.group_id,
-                        "group_name": lineup.group_name,
-                        "opponent_team_id": lineup.opponent_team_id,
-                        "is_home": lineup.is_home,
-                        "game_date": sql_game_date,
-                        "min": lineup.min,
-                        "plus_minus": lineup.plus_minus,
-                        "pts": lineup.pts,
-                        "fgm": lineup.fgm,
-                        "fga": lineup.fga,
-                        "fg_pct": lineup.fg_pct,
-                        "fg3m": lineup.fg3m,
-                        "fg3a": lineup.fg3a,
-                        "fg3_pct": lineup.fg3_pct,
-                        "ftm": lineup.ftm,
-                        "fta": lineup.fta,
-                        "ft_pct": lineup.ft_pct,
-                        "reb": lineup.reb,
-                        "ast": lineup.ast,
-                        "tov": lineup.tov,
-                        "stl": lineup.stl,
-                        "blk": lineup.blk,
-                        "pf": lineup.pf,
-                    })
-                    loaded += 1
-            
-            total_loaded += loaded
-            success_count += 1
-            
-            logger.info(f"  → Loaded {loaded} lineups for game {game_info['game_id']}")
-            
-        except Exception as e:
-            logger.error(f"  → Failed: {e}")
-            fail_count += 1
+        if limit:
+            game_dates = game_dates[:limit]
         
-        time.sleep(sleep_seconds)
+        # Format every date for the API (MM/DD/YYYY) and for SQL (YYYY-MM-DD) in one pass
+        dates_df = pd.DataFrame({"d": pd.to_datetime(game_dates)})
+        dates_df["api"] = dates_df["d"].dt.strftime('%m/%d/%Y')
+        dates_df["sql"] = dates_df["d"].dt.strftime('%Y-%m-%d')
+        
+        date_list = list(zip(
+            dates_df["api"],
+            dates_df["sql"],
+            (game_info_by_date[d] for d in game_dates),
+        ))
+        
+        logger.info(f"Found {len(date_list)} game dates to process")
+        logger.info(f"Concurrency: {max_concurrency} (API calls share the global rate limiter)")
+
+        sem = asyncio.Semaphore(max_concurrency)
+        pending: Optional[List[dict]] = [] if bulk else None
+
+        async def bounded(i: int, api_date: str, sql_date: str, game_info: dict) -> Tuple[str, int]:
+            async with sem:
+                return await _load_lineups_for_date(
+                    conn, api_date, sql_date, game_info,
+                    season, team_id, group_quantity,
+                    f"[{i}/{len(date_list)}]",
+                    pending,
+                )
+
+        results = await asyncio.gather(*[
+            bounded(i, api_date, sql_date, game_info)
+            for i, (api_date, sql_date, game_info) in enumerate(date_list, 1)
+        ])
+
+        if pending:
+            logger.info(f"Bulk loading {len(pending)} lineups via COPY")
+            with conn.begin():
+                bulk_load_lineups(conn, pending)
+
+    total_loaded = sum(loaded for _, loaded in results)
+    success_count = sum(1 for status, _ in results if status == "success")
+    no_data_count = sum(1 for status, _ in results if status == "no_data")
+    fail_count = sum(1 for status, _ in results if status == "failed")
     
     # Summary
     logger.info("")
@@ -389,4 +571,25 @@ def load_season_game_lineups_for_team(
     logger.info(f"Total lineups loaded: {total_loaded}")
     logger.info("=" * 80)
     
-    return total_loaded
\ No newline at end of file
+    return total_loaded
+
+
+def load_season_game_lineups_for_team(
+    engine: Engine,
+    season: str,
+    team_id: int,
+    group_quantity: int = 5,
+    limit: Optional[int] = None,
+    max_concurrency: int = 4,
+    bulk: bool = False
+) -> int:
+    # Sync entry point for the pipeline scripts
+    return asyncio.run(load_season_game_lineups_for_team_async(
+        engine=engine,
+        season=season,
+        team_id=team_id,
+        group_quantity=group_quantity,
+        limit=limit,
+        max_concurrency=max_concurrency,
+        bulk=bulk,
+    ))
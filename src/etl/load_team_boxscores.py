@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, List, Tuple
 
@@ -114,6 +113,9 @@ ON CONFLICT (game_id, team_id) DO UPDATE SET
   last_updated_at = NOW();
 """
 
+SELECT_GAMES_MISSING_TEAMBOX_STMT = text(SQL_SELECT_GAMES_MISSING_TEAMBOX)
+UPSERT_TEAMBOX_STMT = text(SQL_UPSERT_TEAMBOX)
+
 
 # Parsing 
 
@@ -246,12 +248,11 @@ def fetch_teambox_rows(
 def load_teambox_scores(
     engine: Engine,
     season: str, 
-    sleep_seconds: float = 0.8,
     limit: Optional[int] = None
 ) -> None:
     with engine.begin() as conn:
         rows = conn.execute(
-    text(SQL_SELECT_GAMES_MISSING_TEAMBOX),
+    SELECT_GAMES_MISSING_TEAMBOX_STMT,
     {"season": season},
 ).mappings().all()
 
@@ -279,7 +280,7 @@ def load_teambox_scores(
             with engine.begin() as conn:
                 for row in (home_row, away_row):
                     conn.execute(
-                        text(SQL_UPSERT_TEAMBOX),
+                        UPSERT_TEAMBOX_STMT,
                         {
                             "game_id": row.game_id,
                             "team_id": row.team_id,
@@ -323,6 +324,4 @@ def load_teambox_scores(
                         game_id=game_id
                     )
 
-        time.sleep(sleep_seconds)
-
     logger.info(f"Team boxscore load complete. Success={success}, Failed={failed}, Attempted={len(rows)}")
\ No newline at end of file
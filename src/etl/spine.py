@@ -8,6 +8,7 @@ from src.db.engine import get_engine
 
 from src.db.engine import get_engine
 from src.utils.logger import setup_logger 
+from src.utils.nba_utils import call_with_retries
 
 from nba_api.stats.endpoints import LeagueGameFinder
 from nba_api.library.http import NBAHTTP
@@ -33,10 +34,12 @@ NBAHTTP.headers = _nba_headers
 
 def extract_gameids(season: str) -> list[str]:
 
-    lgf = LeagueGameFinder(
-        season_nullable=season,
-        league_id_nullable="00",
-        season_type_nullable="Regular Season"
+    lgf = call_with_retries(
+        lambda: LeagueGameFinder(
+            season_nullable=season,
+            league_id_nullable="00",
+            season_type_nullable="Regular Season"
+        )
     )
     df = lgf.get_data_frames()[0]
     df = df[df["WL"].notna()]
@@ -1,40 +1,67 @@
 from __future__ import annotations
-import time
-from typing import Any, Callable, Optional
+import json
+import logging
+import re
+from typing import Any, Callable
 
-def call_with_retries(
-    call_fn: Callable[[], Any],
-    max_retries: int = 3,
-    backoff_seconds: Optional[list[int]] = None,
-    max_total_wait_seconds: int = 600,  # cap at 4 minutes per call
-) -> Any:
-    """
-    Retry NBA API calls with long backoff (throttle-friendly),
-    but cap total time spent on a single call so backfills keep moving.
-    """
-    if backoff_seconds is None:
-        backoff_seconds = [120, 200, 250]
+import requests
+from tenacity import (
+    Retrying,
+    before_sleep_log,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential_jitter,
+)
+
+from src.utils.logger import setup_logger
+from src.utils.ratelimit import LIMITER
+
+logger = setup_logger(__name__)
 
-    start = time.time()
+# How stats.nba.com throttling surfaces through nba_api: it raises no HTTP status
+# errors, so a throttled request shows up as a timeout, a reset connection, or a
+# non-JSON (HTML error page) body that fails to decode
+THROTTLE_EXCEPTIONS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    json.JSONDecodeError,
+)
 
-    for attempt in range(max_retries):
-        try:
-            return call_fn()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                raise
+# Error message wording that means we are being throttled; 429 only as a whole
+# number so game ids like 0022400429 do not match
+RATE_LIMIT_RE = re.compile(r"\b429\b|too many requests|rate limit|quota", re.IGNORECASE)
 
-            wait = backoff_seconds[min(attempt, len(backoff_seconds) - 1)]
 
-            elapsed = time.time() - start
-            if elapsed + wait > max_total_wait_seconds:
-                raise
+def is_rate_limited(exc: BaseException) -> bool:
+    if isinstance(exc, THROTTLE_EXCEPTIONS):
+        return True
+    return RATE_LIMIT_RE.search(str(exc)) is not None
 
-            print(
-                f"API call failed ({type(e).__name__}: {e}). "
-                f"Retrying in {wait}s (attempt {attempt + 1}/{max_retries})..."
-            )
-            time.sleep(wait)
 
-    raise RuntimeError("Unexpected retry fallthrough")
+def call_with_retries(
+    call_fn: Callable[[], Any],
+    max_retries: int = 5,
+    initial_wait: float = 1.0,
+    max_wait: float = 30.0,
+    max_total_wait_seconds: int = 600,  # cap at 10 minutes per call
+) -> Any:
+    """
+    Retry NBA API calls only on throttling errors (see is_rate_limited), with
+    exponential backoff plus jitter. Other errors raise immediately, and
+    total time spent on a single call is capped so backfills keep moving.
+    Every attempt takes a token from the shared LIMITER first.
+    """
+
+    def attempt() -> Any:
+        LIMITER.acquire()
+        return call_fn()
 
+    retrying = Retrying(
+        retry=retry_if_exception(is_rate_limited),
+        wait=wait_exponential_jitter(multiplier=initial_wait, max=max_wait),
+        stop=stop_after_attempt(max_retries) | stop_after_delay(max_total_wait_seconds),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    return retrying(attempt)
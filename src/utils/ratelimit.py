@@ -0,0 +1,49 @@
+"""
+Process-wide rate limiting for stats.nba.com requests.
+
+Every NBA API call goes through call_with_retries, which takes a token from
+LIMITER first. Loaders running in different threads therefore share one
+request budget instead of each sleeping on its own.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing max_rate calls per time_period."""
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self._lock = threading.Lock()
+        self.configure(max_rate, time_period)
+
+    def configure(self, max_rate: float, time_period: float = 1.0) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+
+        with self._lock:
+            self.max_rate = max_rate
+            self.time_period = time_period
+            # Burst size; at least one token so rates below 1 per period still make progress
+            self.capacity = max(1.0, max_rate)
+            self._tokens = self.capacity
+            self._last_refill = time.monotonic()
+
+    def acquire(self) -> None:
+        # Block until a token is available
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self.max_rate / self.time_period
+                self._tokens = min(self.capacity, self._tokens + refill)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+
+            time.sleep(wait)
+
+
+LIMITER = RateLimiter(max_rate=4, time_period=1.0)
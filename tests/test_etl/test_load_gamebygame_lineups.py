@@ -0,0 +1,270 @@
+"""
+Unit tests for lineup parsing helpers.
+
+Tests cleaning of NBA API GROUP_NAME strings into last-name lists and
+coercion of leaguedashlineups frames into upsert rows, plus COPY
+serialization and when raw responses are cached to disk.
+"""
+import csv
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+import src.etl.load_gamebygame_lineups as lineups
+from src.etl.load_gamebygame_lineups import (
+    LINEUP_COPY_COLUMNS,
+    LINEUP_FLOAT_COLUMNS,
+    LINEUP_INT_COLUMNS,
+    _lineups_to_csv,
+    clean_player_names,
+    clean_player_names_series,
+    extract_lineups_for_date,
+    is_game_final,
+)
+from src.etl.parsing_utils import parse_float, parse_int
+
+
+class TestCleanPlayerNames:
+    
+    def test_initial_and_last_name(self):
+        """Should keep everything after the first initial."""
+        assert clean_player_names("A. Edwards - R. Gobert") == "Edwards; Gobert"
+    
+    def test_hyphenated_and_suffixed_names(self):
+        """Should keep hyphenated last names and suffixes intact."""
+        assert clean_player_names("N. Alexander-Walker - T. Hardaway Jr.") == "Alexander-Walker; Hardaway Jr."
+    
+    def test_full_and_single_names(self):
+        """Should use the last word of full names and keep single names."""
+        assert clean_player_names("Rudy Gobert - Nene") == "Gobert; Nene"
+    
+    def test_skips_empty_parts(self):
+        """Should ignore empty fragments between separators."""
+        assert clean_player_names("J. Randle -  - M. Conley") == "Randle; Conley"
+    
+    def test_missing_values(self):
+        """Should return None for empty or non-string input."""
+        assert clean_player_names("") is None
+        assert clean_player_names(None) is None
+        assert clean_player_names(5) is None
+        assert clean_player_names(" - ") is None
+
+
+class TestCleanPlayerNamesSeries:
+    
+    def test_matches_scalar_version(self):
+        """Should produce the same names as clean_player_names row by row."""
+        names = pd.Series(
+            [
+                "A. Edwards - N. Alexander-Walker - T. Hardaway Jr.",
+                "Rudy Gobert - Nene",
+                "J. Randle -  - M. Conley",
+            ],
+            index=[4, 9, 12],
+        )
+        result = clean_player_names_series(names)
+        
+        assert list(result.index) == [4, 9, 12]
+        assert result.tolist() == [clean_player_names(n) for n in names]
+    
+    def test_missing_values(self):
+        """Should return NaN where the scalar version returns None."""
+        names = pd.Series(["", None, np.nan, " - ", "A. Edwards"])
+        result = clean_player_names_series(names)
+        
+        assert result.iloc[:4].isna().all()
+        assert result.iloc[4] == "Edwards"
+    
+    def test_all_null_column(self):
+        """Should return all NaN for an all-null float64 column instead of raising."""
+        names = pd.Series([np.nan, np.nan], index=[3, 7])
+        result = clean_player_names_series(names)
+        
+        assert list(result.index) == [3, 7]
+        assert result.isna().all()
+
+
+
+class TestExtractLineupsForDate:
+    
+    TEAM_ID = 1610612750
+    
+    def _extract(self, monkeypatch, frame: pd.DataFrame) -> list:
+        monkeypatch.setattr(lineups, "_fetch_lineups_frame", lambda *args: frame)
+        return extract_lineups_for_date("01/15/2025", "2024-25", self.TEAM_ID)
+    
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "TEAM_ID": [self.TEAM_ID, self.TEAM_ID, self.TEAM_ID, 1610612751],
+                "GROUP_ID": ["-1-2-3-4-5-", np.nan, "", "-9-"],
+                "GROUP_NAME": ["A. Edwards - R. Gobert", None, "Nene", "L. James"],
+                "MIN": [12.5, np.nan, "7.25", 3.0],
+                "PLUS_MINUS": [4.0, -3.7, np.nan, 1.0],
+                "PTS": [20, 0, 5, 2],
+                "FGM": ["8", "5.5", "x", "1"],
+                "FG_PCT": [0.5, np.nan, "0.4", 0.1],
+            },
+            index=[10, 11, 12, 13],
+        )
+    
+    def test_matches_parse_helpers(self, monkeypatch):
+        """Should coerce every stat exactly like parse_int/parse_float did per cell."""
+        frame = self._frame()
+        rows = self._extract(monkeypatch, frame)
+        team_frame = frame[frame["TEAM_ID"] == self.TEAM_ID]
+        
+        assert len(rows) == 3
+        for (_, source), row in zip(team_frame.iterrows(), rows):
+            for api_col, field in LINEUP_INT_COLUMNS.items():
+                expected = parse_int(source.get(api_col))
+                assert row[field] == expected, (field, source.get(api_col))
+            for api_col, field in LINEUP_FLOAT_COLUMNS.items():
+                expected = parse_float(source.get(api_col))
+                if expected is None or np.isnan(expected):
+                    assert row[field] is None, field
+                else:
+                    assert row[field] == expected, field
+    
+    def test_nan_becomes_none(self, monkeypatch):
+        """Should bind missing values as None, including absent columns."""
+        rows = self._extract(monkeypatch, self._frame())
+        
+        assert rows[1]["min"] is None
+        assert rows[2]["plus_minus"] is None
+        assert rows[1]["group_name"] is None
+        assert all(row["reb"] is None for row in rows)
+
+    def test_missing_group_name_column(self, monkeypatch):
+        """Should bind group_name as None when GROUP_NAME is absent from the response."""
+        rows = self._extract(monkeypatch, self._frame().drop(columns=["GROUP_NAME"]))
+
+        assert len(rows) == 3
+        assert all(row["group_name"] is None for row in rows)
+    
+    def test_group_id_fallback(self, monkeypatch):
+        """Should generate a date-based group_id when GROUP_ID is missing or blank."""
+        rows = self._extract(monkeypatch, self._frame())
+        
+        assert rows[0]["group_id"] == "-1-2-3-4-5-"
+        assert rows[1]["group_id"] == "date_01152025_lineup_11"
+        assert rows[2]["group_id"] == "date_01152025_lineup_12"
+    
+    def test_values_are_python_scalars(self, monkeypatch):
+        """Should return plain int/float values that psycopg2 can adapt."""
+        rows = self._extract(monkeypatch, self._frame())
+        
+        for row in rows:
+            for field in LINEUP_INT_COLUMNS.values():
+                assert row[field] is None or type(row[field]) is int, field
+            for field in LINEUP_FLOAT_COLUMNS.values():
+                assert row[field] is None or type(row[field]) is float, field
+        
+        assert rows[0]["team_id"] == self.TEAM_ID
+        assert rows[0]["season"] == "2024-25"
+        assert rows[0]["group_quantity"] == 5
+
+
+class TestLineupsToCsv:
+    
+    def _row(self, **overrides) -> dict:
+        row = {col: None for col in LINEUP_COPY_COLUMNS}
+        row.update(
+            game_id="0022400123", season="2024-25", team_id=1610612750,
+            group_quantity=5, group_id="-1-2-3-4-5-", group_name="Edwards; Gobert",
+            opponent_team_id=1610612747, is_home=True, game_date="2025-01-15",
+            min=12.5, plus_minus=-3, pts=20, fg_pct=0.4,
+        )
+        row.update(overrides)
+        return row
+    
+    def test_column_order(self):
+        """Should write values in LINEUP_COPY_COLUMNS order, one line per row."""
+        buf = _lineups_to_csv([self._row(), self._row(group_id="-6-")])
+        records = list(csv.reader(buf))
+        
+        assert len(records) == 2
+        assert len(records[0]) == len(LINEUP_COPY_COLUMNS)
+        fields = dict(zip(LINEUP_COPY_COLUMNS, records[0]))
+        assert fields["game_id"] == "0022400123"
+        assert fields["team_id"] == "1610612750"
+        assert fields["group_name"] == "Edwards; Gobert"
+        assert fields["game_date"] == "2025-01-15"
+        assert dict(zip(LINEUP_COPY_COLUMNS, records[1]))["group_id"] == "-6-"
+    
+    def test_none_is_unquoted_empty(self):
+        """Should write None as an unquoted empty field, which COPY reads as NULL."""
+        line = _lineups_to_csv([self._row(group_name=None, reb=None)]).getvalue()
+        fields = line.rstrip("\r\n").split(",")
+        
+        assert fields[LINEUP_COPY_COLUMNS.index("group_name")] == ""
+        assert fields[LINEUP_COPY_COLUMNS.index("reb")] == ""
+        assert '""' not in line
+    
+    def test_bool_and_float_formatting(self):
+        """Should write booleans and floats in forms Postgres accepts."""
+        buf = _lineups_to_csv([self._row(), self._row(is_home=False, min=0.1, fg_pct=1.0)])
+        home, away = (dict(zip(LINEUP_COPY_COLUMNS, r)) for r in csv.reader(buf))
+        
+        assert home["is_home"] == "True"
+        assert away["is_home"] == "False"
+        assert home["min"] == "12.5"
+        assert home["plus_minus"] == "-3"
+        assert away["min"] == "0.1"
+        assert away["fg_pct"] == "1.0"
+
+
+def _frozen_datetime(now: datetime) -> type:
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+    return FrozenDatetime
+
+
+class TestLineupCache:
+    
+    GAME_DATE = "01/15/2025"
+    
+    def _fetch(self, monkeypatch, tmp_path, now: datetime) -> pd.DataFrame:
+        calls = []
+        
+        class FakeEndpoint:
+            def get_data_frames(self):
+                calls.append(1)
+                return [pd.DataFrame({"GROUP_ID": ["-1-2-3-4-5-"], "PTS": [len(calls)]})]
+        
+        monkeypatch.setattr(lineups, "LINEUP_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(lineups, "datetime", _frozen_datetime(now))
+        monkeypatch.setattr(lineups, "call_with_retries", lambda fn: FakeEndpoint())
+        return lineups._fetch_lineups_frame(self.GAME_DATE, "2024-25", 1610612750, 5)
+    
+    def test_is_game_final_cutoff(self):
+        """Should treat a date as final from noon UTC the day after, not at midnight."""
+        game_date = date(2025, 1, 15)
+        
+        assert not is_game_final(game_date, datetime(2025, 1, 16, 6, 0, tzinfo=timezone.utc))
+        assert not is_game_final(game_date, datetime(2025, 1, 16, 11, 59, tzinfo=timezone.utc))
+        assert is_game_final(game_date, datetime(2025, 1, 16, 12, 0, tzinfo=timezone.utc))
+    
+    def test_does_not_cache_inside_window(self, monkeypatch, tmp_path):
+        """Should not pickle a response fetched while the game may still be live."""
+        now = datetime(2025, 1, 16, 6, 0, tzinfo=timezone.utc)
+        first = self._fetch(monkeypatch, tmp_path, now)
+        second = self._fetch(monkeypatch, tmp_path, now)
+        
+        assert not list(tmp_path.rglob("*.pkl"))
+        assert first["PTS"].iloc[0] == 1
+        assert second["PTS"].iloc[0] == 1
+    
+    def test_caches_once_final(self, monkeypatch, tmp_path):
+        """Should pickle the response after the cutoff and serve it on the next fetch."""
+        now = datetime(2025, 1, 16, 12, 0, tzinfo=timezone.utc)
+        self._fetch(monkeypatch, tmp_path, now)
+        
+        monkeypatch.setattr(lineups, "call_with_retries", lambda fn: pytest.fail("should use cache"))
+        cached = lineups._fetch_lineups_frame(self.GAME_DATE, "2024-25", 1610612750, 5)
+        
+        assert len(list(tmp_path.rglob("*.pkl"))) == 1
+        assert cached["PTS"].iloc[0] == 1
@@ -0,0 +1 @@
+"""Test package for utils module tests."""
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Unit tests for NBA API call helpers.
+
+Tests which errors are treated as throttling and retried.
+"""
+import json
+
+import pytest
+import requests
+from src.utils.nba_utils import call_with_retries, is_rate_limited
+
+
+class TestIsRateLimited:
+    
+    def test_timeout(self):
+        """Should treat request timeouts as throttling."""
+        assert is_rate_limited(requests.exceptions.ReadTimeout("read timed out"))
+        assert is_rate_limited(requests.exceptions.ConnectTimeout("connect timed out"))
+    
+    def test_connection_reset(self):
+        """Should treat dropped or reset connections as throttling."""
+        assert is_rate_limited(requests.exceptions.ConnectionError("Connection reset by peer"))
+    
+    def test_non_json_response(self):
+        """Should treat an HTML error page that fails to decode as throttling."""
+        assert is_rate_limited(json.JSONDecodeError("Expecting value", "<html>", 0))
+        assert is_rate_limited(requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0))
+    
+    def test_rate_limit_messages(self):
+        """Should match rate-limit wording regardless of case."""
+        assert is_rate_limited(Exception("HTTP 429"))
+        assert is_rate_limited(Exception("Too Many Requests"))
+        assert is_rate_limited(Exception("Rate limit exceeded"))
+        assert is_rate_limited(Exception("Quota exhausted"))
+        assert is_rate_limited(Exception("status code: 429"))
+    
+    def test_429_inside_other_numbers(self):
+        """Should not match 429 inside a longer number such as a game id."""
+        assert not is_rate_limited(ValueError("No game found for game_id 0022400429"))
+        assert not is_rate_limited(ValueError("player 14290 not found"))
+    
+    def test_other_errors(self):
+        """Should not retry ordinary failures."""
+        assert not is_rate_limited(ValueError("bad game_id"))
+        assert not is_rate_limited(KeyError("resultSets"))
+
+
+class TestCallWithRetries:
+    
+    def test_returns_result(self):
+        """Should return the call's result on success."""
+        assert call_with_retries(lambda: 42) == 42
+    
+    def test_non_rate_limit_error_not_retried(self):
+        """Should raise immediately on errors that are not throttling."""
+        calls = []
+        
+        def fail():
+            calls.append(1)
+            raise ValueError("bad game_id")
+        
+        with pytest.raises(ValueError):
+            call_with_retries(fail)
+        assert len(calls) == 1
+    
+    def test_rate_limit_error_retried(self):
+        """Should retry throttling errors and return once the call succeeds."""
+        calls = []
+        
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise Exception("429 Too Many Requests")
+            return "ok"
+        
+        assert call_with_retries(flaky, initial_wait=0, max_wait=0) == "ok"
+        assert len(calls) == 2
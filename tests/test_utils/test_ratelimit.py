@@ -0,0 +1,62 @@
+"""
+Unit tests for the NBA API rate limiter.
+
+Tests token bucket burst size and pacing, including sub-1 rates.
+"""
+import threading
+import time
+
+import pytest
+from src.utils.ratelimit import RateLimiter
+
+
+def _acquire_with_timeout(limiter: RateLimiter, timeout: float) -> bool:
+    """Run acquire() in a thread; return False if it is still blocked after timeout."""
+    worker = threading.Thread(target=limiter.acquire, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    return not worker.is_alive()
+
+
+class TestRateLimiter:
+    
+    def test_burst_up_to_max_rate(self):
+        """Should allow max_rate calls immediately."""
+        limiter = RateLimiter(max_rate=4, time_period=1.0)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
+    
+    def test_paces_after_burst(self):
+        """Should wait for a refill once the burst is used up."""
+        limiter = RateLimiter(max_rate=5, time_period=0.5)
+        start = time.monotonic()
+        for _ in range(7):
+            limiter.acquire()
+        # 2 calls beyond the burst at 10/s need ~0.2s
+        assert time.monotonic() - start >= 0.15
+    
+    def test_rate_below_one(self):
+        """Should not hang when max_rate is below one call per period."""
+        limiter = RateLimiter(max_rate=0.5, time_period=0.1)
+        assert _acquire_with_timeout(limiter, 1.0)
+        
+        # Next token needs 0.2s at 0.5 calls per 0.1s
+        start = time.monotonic()
+        assert _acquire_with_timeout(limiter, 1.0)
+        assert time.monotonic() - start >= 0.15
+    
+    def test_configure_resets_rate(self):
+        """Should apply a new rate and burst size."""
+        limiter = RateLimiter(max_rate=4)
+        limiter.configure(max_rate=0.5)
+        assert limiter.capacity == 1.0
+        assert _acquire_with_timeout(limiter, 1.0)
+    
+    def test_invalid_rate(self):
+        """Should reject non-positive rates."""
+        with pytest.raises(ValueError):
+            RateLimiter(max_rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(max_rate=1, time_period=-1)